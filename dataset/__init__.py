@@ -1 +1,2 @@
 from .protein_graph_dataset import *
+from .pt_file_dataset import *
@@ -2,4 +2,5 @@ from typing import final
 
 NM_EIGENVECTORS: final = "nma_eigenvectors"
 NM_EIGENVALUES: final = "nma_eigenvalues"
+PACKED_DATASET_FILENAME: final = "packed_dataset.pt"
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import gzip
+import os
 import shutil
 from typing import Iterable, Union
 from typing import Optional
@@ -15,7 +16,7 @@ from sklearn.neighbors import NearestNeighbors
 from torch_geometric.data import Data, HeteroData
 from torch_geometric.transforms import BaseTransform
 
-from dataset.constants import NM_EIGENVALUES
+from dataset.constants import NM_EIGENVALUES, PACKED_DATASET_FILENAME
 
 
 def extract_compressed_file(file_path: str):
@@ -29,6 +30,26 @@ def extract_compressed_file(file_path: str):
     return extracted_file_path
 
 
+def pack_dataset(data_root_dir: str, out_path: Optional[str] = None) -> str:
+    """
+    Pack the per-sample ``.pt`` files in ``data_root_dir`` into a single zipfile-serialized
+    archive that can be memory-mapped at training time, turning N small random reads into
+    one sequential mapped read. Returns the path of the packed file.
+    """
+    if out_path is None:
+        out_path = os.path.join(data_root_dir, PACKED_DATASET_FILENAME)
+
+    samples = []
+    for filename in sorted(os.listdir(data_root_dir)):
+        file_path = os.path.join(data_root_dir, filename)
+
+        if os.path.isfile(file_path) and filename.endswith(".pt") and filename != PACKED_DATASET_FILENAME:
+            samples.append(torch.load(file_path, map_location="cpu"))
+
+    torch.save(samples, out_path, _use_new_zipfile_serialization=True)
+    return out_path
+
+
 # original source: https://github.com/Attornado/protein-representation-learning/
 class NodeFeatureFormatter(BaseTransform):
     def __init__(self, feature_columns: Optional[list[str]] = None):
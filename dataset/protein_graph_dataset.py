@@ -1,4 +1,5 @@
 import glob
+import multiprocessing
 import os
 import os.path as osp
 from functools import partial
@@ -74,19 +75,28 @@ class ProteinGraphDataset(Dataset):
         config = ProteinGraphConfig(node_metadata_functions=list(NODE_METADATA_FUNCTIONS.values()),
                                     edge_construction_functions=EDGE_CONSTRUCTION_FUNCTIONS)
 
-        for idx, raw_path in enumerate(tqdm(self.raw_paths, desc="Processing files", unit="file")):
-            filename = osp.basename(extract_compressed_file(raw_path))
-            protein_name = filename.split('-')[1]
+        # graph construction and pre_transform are CPU-bound and independent per file,
+        # so the one-time preprocessing pass is spread across all the cores
+        with multiprocessing.Pool(os.cpu_count()) as pool:
+            with tqdm(total=len(self.raw_paths), desc="Processing files", unit="file") as progress_bar:
+                for _ in pool.imap_unordered(partial(self._process_raw_file, config=config),
+                                             enumerate(self.raw_paths)):
+                    progress_bar.update()
 
-            try:
-                pyg_graph = from_networkx(construct_graph(uniprot_id=protein_name, config=config, verbose=False))
+    def _process_raw_file(self, indexed_raw_path, config):
+        idx, raw_path = indexed_raw_path
+        filename = osp.basename(extract_compressed_file(raw_path))
+        protein_name = filename.split('-')[1]
 
-                torch.save(self.__apply_transform(pyg_graph, "pre_transform"),
-                           osp.join(self.processed_dir, f'data_{idx}.pt'))
-            except:
-                pass
+        try:
+            pyg_graph = from_networkx(construct_graph(uniprot_id=protein_name, config=config, verbose=False))
 
-            os.unlink(osp.join(self.raw_dir, filename))
+            torch.save(self.__apply_transform(pyg_graph, "pre_transform"),
+                       osp.join(self.processed_dir, f'data_{idx}.pt'))
+        except:
+            pass
+
+        os.unlink(osp.join(self.raw_dir, filename))
 
     def len(self):
         return len(self.processed_file_names)
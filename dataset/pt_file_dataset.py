@@ -0,0 +1,28 @@
+import os
+
+import torch
+from torch.utils.data import Dataset
+
+from dataset.constants import PACKED_DATASET_FILENAME
+
+
+class LazyPtDataset(Dataset):
+    """
+    Dataset over a directory of per-sample ``.pt`` files that stores only the file paths
+    and loads each sample on demand in ``__getitem__``. Peak memory stays proportional to
+    the batch size and DataLoader workers can parallelize the file reads.
+    """
+
+    def __init__(self, root: str):
+        self.paths = [os.path.join(root, filename) for filename in sorted(os.listdir(root))
+                      if filename.endswith(".pt") and filename != PACKED_DATASET_FILENAME]
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __getitem__(self, idx):
+        return torch.load(self.paths[idx], map_location="cpu")
+
+    @property
+    def num_node_features(self) -> int:
+        return self[0].num_node_features
@@ -65,6 +65,20 @@ if __name__ == "__main__":
     parser.add_argument("--val_split_percentage", type=int, default=VALIDATION_SPLIT_PERCENTAGE)
     parser.add_argument("--batch_size", type=int, default=BATCH_SIZE)
     parser.add_argument("--shuffle", action="store_false", default=True)
+    parser.add_argument("--num_workers", type=int, default=None,
+                        help="Number of DataLoader worker processes. Defaults to half the available cores")
+    parser.add_argument("--pin_memory", action="store_false", default=None,
+                        help="Disable pinned memory for the dataloaders. Defaults to pinning when CUDA is available")
+    parser.add_argument("--persistent_workers", action="store_false", default=True)
+    parser.add_argument("--prefetch_factor", type=int, default=PREFETCH_FACTOR)
+    parser.add_argument("--log_every_n_steps", type=int, default=LOG_EVERY_N_STEPS,
+                        help="Number of batches between two step-level metric logs")
+    parser.add_argument("--compile", action="store_true", default=False,
+                        help="Compile the model with torch.compile when CUDA is available")
+    parser.add_argument("--precision", type=str, default="fp32", choices=["fp32", "bf16", "fp16"],
+                        help="Numerical precision for the train/val forward passes on CUDA")
+    parser.add_argument("--cudnn_benchmark", action="store_false", default=True,
+                        help="Disable cuDNN autotuning and TF32 for reproducibility-critical runs")
     parser.add_argument("--n_epochs", type=int, default=N_EPOCHS)
     parser.add_argument("--project_name", type=str, default="c3dp")
     parser.add_argument("--run_name", type=str, default=None)
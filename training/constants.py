@@ -2,3 +2,5 @@ TRAINING_SPLIT_PERCENTAGE = 80.0
 VALIDATION_SPLIT_PERCENTAGE = 10.0
 N_EPOCHS = 50
 BATCH_SIZE = 8
+PREFETCH_FACTOR = 2
+LOG_EVERY_N_STEPS = 16
@@ -1,4 +1,5 @@
-from threading import Lock
+import queue
+from threading import Lock, Thread
 from typing import Optional
 
 
@@ -58,3 +59,44 @@ class Logger:
 
         if self.lock:
             self.lock.release()
+
+
+class AsyncLogger:
+    def __init__(self, logger: Logger):
+        """
+        Wraps a :class:`Logger` and moves the writes to a background daemon thread, so that logging
+        from the training loop never blocks on slow storage.
+        :param logger: the wrapped logger that performs the actual writes
+        """
+        self.__logger: Logger = logger
+        self.__queue: queue.Queue = queue.Queue()
+        self.__thread: Thread = Thread(target=self.__drain, daemon=True)
+        self.__thread.start()
+
+    @property
+    def logger(self) -> Logger:
+        return self.__logger
+
+    def log(self, string: str, print_to_stdout: bool = True):
+        self.__queue.put((string, print_to_stdout))
+
+    def __drain(self):
+        while True:
+            item = self.__queue.get()
+
+            if item is None:
+                self.__queue.task_done()
+                break
+
+            string, print_to_stdout = item
+            self.__logger.log(string, print_to_stdout=print_to_stdout)
+            self.__queue.task_done()
+
+    def flush(self):
+        """Blocks until every queued message has been written."""
+        self.__queue.join()
+
+    def close(self):
+        """Flushes the queue and stops the background thread."""
+        self.__queue.put(None)
+        self.__thread.join()
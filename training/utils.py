@@ -1,19 +1,24 @@
+import functools
+import io
 import os
 import sys
-from typing import Tuple, Union, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, Union, List
 
 import numpy as np
 import torch
 import wandb
-from torch.utils.data import random_split
+from torch.utils.data import SubsetRandomSampler
 from torch_geometric import seed_everything
 from torch_geometric.loader import DataLoader
 from tqdm import tqdm
 
-from dataset import ProteinGraphDataset, NODE_METADATA_FUNCTIONS
+from dataset import LazyPtDataset, ProteinGraphDataset, NODE_METADATA_FUNCTIONS
+from dataset.constants import PACKED_DATASET_FILENAME
 from dataset.preprocessing import NodeFeatureFormatter
 from models.c3dp import C3DPNet
-from training.logger import Logger
+from training.constants import LOG_EVERY_N_STEPS, PREFETCH_FACTOR
+from training.logger import AsyncLogger, Logger
 
 
 # All credits go to Bjarten and the other contributors: https://github.com/Bjarten/early-stopping-pytorch.git
@@ -44,6 +49,11 @@ class EarlyStopping:
         self.path = path
         self.dir_path = os.path.dirname(path)
         self.trace_func = trace_func
+        self._path_root, self._ext = os.path.splitext(path)
+        self._last_model_path = None
+        # single worker so checkpoint writes happen off the training thread but stay ordered
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._last_flush = None
 
     def __call__(self, val_loss, model, optimizer):
 
@@ -65,26 +75,55 @@ class EarlyStopping:
     def save_checkpoint(self, val_loss, model, optimizer):
         """Saves model when validation loss decrease."""
 
-        p = os.path.splitext(self.path)
-        model_path = p[0] + f"-state-dict-val_loss={val_loss:.6f}" + p[1]
-        constructor_parameters_path = p[0] + "-parameters" + p[1]
-        optimizer_path = "optimizer-state-dict" + p[1]
+        # surface any failure of the previous background write before claiming a new best
+        self._wait_for_flush()
+
+        model_path = self._path_root + f"-state-dict-val_loss={val_loss:.6f}" + self._ext
+        constructor_parameters_path = self._path_root + "-parameters" + self._ext
+        optimizer_path = "optimizer-state-dict" + self._ext
 
         if self.verbose:
             self.trace_func(
                 f'Validation loss decreased ({self.val_loss_min:.6f} --> {val_loss:.6f}).  '
                 f'Saving model to {model_path}')
 
-        # remove all previous checkpoints 
-        for filename in os.listdir(self.dir_path):
-            if filename.endswith(p[1]):
-                os.remove(os.path.join(self.dir_path, filename))
-
-        torch.save(model.state_dict(), model_path)
-        torch.save(model.constructor_serializable_parameters(), constructor_parameters_path)
-        torch.save(optimizer.state_dict(), os.path.join(self.dir_path, optimizer_path))
+        # serialize on the training thread (the tensors are copied to the CPU here),
+        # then hand the buffers to the background worker so disk I/O overlaps the next epoch
+        checkpoints = []
+        for obj, path in ((({k: v.detach().cpu() for k, v in model.state_dict().items()}), model_path),
+                          (model.constructor_serializable_parameters(), constructor_parameters_path),
+                          (optimizer.state_dict(), os.path.join(self.dir_path, optimizer_path))):
+            buffer = io.BytesIO()
+            torch.save(obj, buffer)
+            checkpoints.append((path, buffer.getvalue()))
+
+        self._last_flush = self._io_pool.submit(self._flush, checkpoints, self._last_model_path)
+        self._last_model_path = model_path
         self.val_loss_min = val_loss
 
+    def _wait_for_flush(self):
+        """Waits for the in-flight checkpoint write, re-raising any exception it hit."""
+        if self._last_flush is not None:
+            self._last_flush.result()
+            self._last_flush = None
+
+    def _flush(self, checkpoints, previous_model_path):
+        """Removes the previous model checkpoint and writes the serialized new ones to disk."""
+
+        # the parameters and optimizer files are overwritten in place; only the loss-tagged
+        # model checkpoint changes name between saves, so a single unlink replaces the dir scan
+        if previous_model_path is not None and os.path.exists(previous_model_path):
+            os.remove(previous_model_path)
+
+        for path, payload in checkpoints:
+            with open(path, 'wb') as f:
+                f.write(payload)
+
+    def close(self):
+        """Blocks until any in-flight checkpoint write has completed, re-raising its errors."""
+        self._wait_for_flush()
+        self._io_pool.shutdown(wait=True)
+
 
 def get_splits(n_instances: int, train_split_percentage: float, val_split_percentage: float) -> Tuple[int, int, int]:
     """
@@ -115,47 +154,88 @@ def get_splits(n_instances: int, train_split_percentage: float, val_split_percen
     return train_split, val_split, test_split
 
 
+def _load_state_dict(path: str, device: torch.device) -> dict:
+    try:
+        # mmap avoids staging the whole file in RAM and copies tensors lazily per-key;
+        # weights_only skips arbitrary pickle execution during deserialization
+        return torch.load(path, map_location=device, mmap=True, weights_only=True)
+    except TypeError:
+        # torch < 2.1 does not accept these kwargs
+        return torch.load(path, map_location=device)
+
+
 def load_model_checkpoint(checkpoint_path: str, device: torch.device, load_optimizer: bool = False) \
         -> Union[Tuple[dict, dict, dict], Tuple[dict, dict]]:
     checkpoint_dir = os.path.dirname(checkpoint_path)
     # get graph model name
     graph_model_name = os.path.basename(checkpoint_path).split("-")[0]
     ext = os.path.splitext(checkpoint_path)[1]
-    # get constructor parameters
+    # get constructor parameters (plain torch.load: they contain non-tensor Python objects)
     constructor_parameters = torch.load(os.path.join(checkpoint_dir, f"{graph_model_name}-parameters{ext}"))
-    model_state_dict = torch.load(checkpoint_path, map_location=device)
+    model_state_dict = _load_state_dict(checkpoint_path, device)
 
     if load_optimizer:
         # get optimizer checkpoint
         return model_state_dict, constructor_parameters, \
-            torch.load(os.path.join(checkpoint_dir, f"optimizer-state-dict{ext}"), map_location=device)
+            _load_state_dict(os.path.join(checkpoint_dir, f"optimizer-state-dict{ext}"), device)
 
     return model_state_dict, constructor_parameters
 
 
 def load_dataset(dataset_name: str, data_root_dir: str, batch_size: int, training_split_percentage: int,
-                 val_split_percentage: int,
-                 shuffle: bool) -> Tuple[Union[ProteinGraphDataset, List], DataLoader, DataLoader]:
+                 val_split_percentage: int, shuffle: bool, num_workers: Optional[int] = None,
+                 pin_memory: Optional[bool] = None, persistent_workers: bool = True,
+                 prefetch_factor: int = PREFETCH_FACTOR) -> Tuple[Union[ProteinGraphDataset, List],
+                                                                  DataLoader, DataLoader]:
     dataset = []
 
+    if num_workers is None:
+        num_workers = os.cpu_count() // 2
+
+    # pinned memory only pays off when batches are copied to a CUDA device (MPS does not benefit)
+    if pin_memory is None:
+        pin_memory = torch.cuda.is_available()
+
+    loader_kwargs = {"num_workers": num_workers, "pin_memory": pin_memory}
+
+    # persistent_workers and prefetch_factor are only valid with multiprocessing enabled
+    if num_workers > 0:
+        loader_kwargs["persistent_workers"] = persistent_workers
+        loader_kwargs["prefetch_factor"] = prefetch_factor
+
     if dataset_name == "proteins":
         dataset = ProteinGraphDataset(root=data_root_dir,
                                       pre_transform=NodeFeatureFormatter(list(NODE_METADATA_FUNCTIONS.keys())))
     else:
-        for filename in os.listdir(data_root_dir):
-            file_path = os.path.join(data_root_dir, filename)
-
-            # Check if it is a file (not a subdirectory)
-            if os.path.isfile(file_path) and ".pt" in file_path:
-                # Load data using torch.load and append to the list
-                dataset.append(torch.load(file_path))
+        packed_path = os.path.join(data_root_dir, PACKED_DATASET_FILENAME)
+
+        if os.path.isfile(packed_path):
+            # one sequential mapped read instead of one open + unpickle per sample;
+            # tensor storages are faulted in lazily through the page cache
+            try:
+                dataset = torch.load(packed_path, map_location="cpu", mmap=True)
+            except TypeError:
+                # mmap requires torch >= 2.1
+                dataset = torch.load(packed_path, map_location="cpu")
+        else:
+            # store only the file paths; the DataLoader workers load samples on demand
+            dataset = LazyPtDataset(data_root_dir)
 
     train_split, val_split, test_split = get_splits(n_instances=len(dataset),
                                                     train_split_percentage=training_split_percentage,
                                                     val_split_percentage=val_split_percentage)
-    train_ds, val_ds, test_ds = random_split(dataset, [train_split, val_split, test_split])
-    train_dataloader = DataLoader(train_ds, batch_size=batch_size, shuffle=shuffle)
-    val_dataloader = DataLoader(val_ds, batch_size=batch_size, shuffle=shuffle)
+
+    # a single permutation (reproducible through seed_everything) and index-based samplers over
+    # the parent dataset avoid the Subset indirection random_split adds on every __getitem__
+    perm = torch.randperm(len(dataset)).tolist()
+    train_indices = perm[:train_split]
+    val_indices = perm[train_split:train_split + val_split]
+
+    train_sampler = SubsetRandomSampler(train_indices) if shuffle else train_indices
+
+    train_dataloader = DataLoader(dataset, batch_size=batch_size, sampler=train_sampler, **loader_kwargs)
+    # validation visits its indices in a fixed order, so the page cache is reused across epochs
+    val_dataloader = DataLoader(dataset, batch_size=batch_size, sampler=val_indices, **loader_kwargs)
 
     return dataset, train_dataloader, val_dataloader
 
@@ -182,10 +262,17 @@ def train_model(args, config=None):
             args["dna_embeddings_pool"] = config["dna_embeddings_pool"]
             args["graph_embeddings_pool"] = config["graph_embeddings_pool"]
 
-        logger = Logger(filepath=os.path.join(experiment_dir, "trainlog.txt"), mode="a")
+        logger = AsyncLogger(Logger(filepath=os.path.join(experiment_dir, "trainlog.txt"), mode="a"))
 
         seed_everything(seed=args["seed"])
 
+        if args["cudnn_benchmark"] and torch.cuda.is_available():
+            # let cuDNN autotune kernels for the recurring batch shapes and allow
+            # TF32 on Ampere+ for the sequence/projection matmuls
+            torch.backends.cudnn.benchmark = True
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
+
         logger.log(f"Seed everything to: {args['seed']}\n"
                    f"Launching training for experiment {wandb.run.id}: \n"
                    f"Experiment dir: {experiment_dir} \n"
@@ -200,7 +287,11 @@ def train_model(args, config=None):
                                                                  training_split_percentage=args[
                                                                      "training_split_percentage"],
                                                                  val_split_percentage=args["val_split_percentage"],
-                                                                 shuffle=args["shuffle"])
+                                                                 shuffle=args["shuffle"],
+                                                                 num_workers=args["num_workers"],
+                                                                 pin_memory=args["pin_memory"],
+                                                                 persistent_workers=args["persistent_workers"],
+                                                                 prefetch_factor=args["prefetch_factor"])
 
         logger.log(f"Loaded dataset: {args['dataset_name']} \n"
                    f"==================\n"
@@ -208,8 +299,9 @@ def train_model(args, config=None):
                    f"Dataset size: {len(dataset)} \n")
 
         if args["in_channels"] is None:
+            # every path infers the per-node feature dimension of the first sample
             if isinstance(dataset, List):
-                args["in_channels"] = dataset[0].x.shape[0]
+                args["in_channels"] = dataset[0].num_node_features
             else:
                 args["in_channels"] = dataset.num_node_features
 
@@ -229,6 +321,15 @@ def train_model(args, config=None):
         device = torch.device("cuda:0" if torch.cuda.is_available()
                               else "mps" if torch.backends.mps.is_available() else "cpu")
         dtype = None if device != "mps" else torch.float32
+        # pinned batches can be copied asynchronously, overlapping the HtoD transfer with compute
+        non_blocking = device.type == "cuda"
+
+        # mixed-precision setup: bf16 needs no loss scaling, fp16 gradients are rescaled to avoid underflow
+        autocast_dtype = {"bf16": torch.bfloat16, "fp16": torch.float16}.get(args["precision"])
+        if autocast_dtype is not None and device.type != "cuda":
+            logger.log(f"Precision '{args['precision']}' requires CUDA, falling back to fp32\n")
+            autocast_dtype = None
+        scaler = torch.cuda.amp.GradScaler() if autocast_dtype == torch.float16 else None
 
         if args["checkpoint_path"] is not None:
             model_state_dict, constructor_parameters, optimizer_state_dict = \
@@ -274,6 +375,12 @@ def train_model(args, config=None):
                             **gnn_parameters)
 
         model = model.to(device, dtype=dtype)
+
+        if args["compile"] and torch.cuda.is_available() and hasattr(torch, "compile"):
+            # PyG ops may graph-break, so fullgraph stays off; dynamic=True since batch shapes vary
+            logger.log("Compiling model with torch.compile...\n")
+            model = torch.compile(model, dynamic=True)
+
         logger.log(f"Loaded model: {model}\n")
 
         optimizer = getattr(torch.optim, args["optimizer"])(model.parameters(), lr=args["learning_rate"],
@@ -287,41 +394,85 @@ def train_model(args, config=None):
 
         logger.log("Starting training...\n")
 
+        n_val_batches = len(val_dataloader)
+        # train and validation use the same batch size, so this reuses one cached tensor run-wide
+        val_batch_size = val_dataloader.batch_size
+        gt_val_full = _ground_truth(val_batch_size, device)
+
         for epoch in range(args["n_epochs"]):
             avg_train_loss, train_acc = train_epoch(model=model, train_dataloader=train_dataloader, optimizer=optimizer,
-                                                    epoch=epoch, n_epochs=args["n_epochs"])
+                                                    epoch=epoch, n_epochs=args["n_epochs"],
+                                                    log_every_n_steps=args["log_every_n_steps"],
+                                                    autocast_dtype=autocast_dtype, scaler=scaler)
 
             # validation step
             model.eval()
-            val_loss = 0.0
 
-            progress_bar = tqdm(enumerate(val_dataloader), total=len(val_dataloader), file=sys.stdout,
+            progress_bar = tqdm(enumerate(val_dataloader), total=n_val_batches, file=sys.stdout,
                                 desc=f'Validation')
 
-            val_acc = torch.tensor(0)
+            # accumulate the running accuracy on-device; the scalar is read once per epoch
+            val_acc = torch.zeros((), device=device)
+            val_loss = torch.zeros((), device=device)
+            window_loss = torch.zeros((), device=device)
+            window_acc = torch.zeros((), device=device)
+            val_step_losses, val_step_accs = [], []
             with torch.no_grad():
                 for batch_idx, data in progress_bar:
-                    data = data.to(device, dtype)
-                    output = model(data.x, data.edge_index, data.sequence_A, data.batch, return_dict=True)
-                    val_loss += output["loss"].item()
+                    data = data.to(device, dtype, non_blocking=non_blocking)
+
+                    if autocast_dtype is not None:
+                        with torch.autocast(device_type="cuda", dtype=autocast_dtype):
+                            output = model(data.x, data.edge_index, data.sequence_A, data.batch, return_dict=True)
+                    else:
+                        output = model(data.x, data.edge_index, data.sequence_A, data.batch, return_dict=True)
 
-                    acc = compute_accuracy(output["logits"], len(data))
+                    val_loss += output["loss"].detach()
+
+                    n_graphs = data.num_graphs
+                    ground_truth = gt_val_full if n_graphs == val_batch_size else _ground_truth(n_graphs, device)
+                    acc = compute_accuracy(output["logits"], n_graphs, ground_truth=ground_truth)
                     val_acc = compute_running_accuracy(acc, val_acc, batch_idx + 1)
 
-                    progress_bar.set_postfix({"val_loss_step": output["loss"].item(), "val_acc_step": acc.item()})
-                    wandb.log({"val_loss_step": output["loss"].item(), "val_acc_step": acc.item()})
+                    window_loss += output["loss"].detach()
+                    window_acc += acc
+
+                    if (batch_idx + 1) % args["log_every_n_steps"] == 0:
+                        val_loss_step, val_acc_step = (torch.stack([window_loss, window_acc])
+                                                       / args["log_every_n_steps"]).cpu().tolist()
+                        progress_bar.set_postfix({"val_loss_step": val_loss_step, "val_acc_step": val_acc_step})
+                        val_step_losses.append(val_loss_step)
+                        val_step_accs.append(val_acc_step)
+                        window_loss.zero_()
+                        window_acc.zero_()
+
+            # flush the trailing partial window so short loops and remainder batches are not dropped
+            remainder = n_val_batches % args["log_every_n_steps"]
+            if remainder:
+                val_loss_step, val_acc_step = (torch.stack([window_loss, window_acc]) / remainder).cpu().tolist()
+                progress_bar.set_postfix({"val_loss_step": val_loss_step, "val_acc_step": val_acc_step})
+                val_step_losses.append(val_loss_step)
+                val_step_accs.append(val_acc_step)
 
             progress_bar.close()
 
-            val_loss = val_loss / len(val_dataloader)
+            val_loss = (val_loss / n_val_batches).item()
+            val_acc = val_acc.item()
 
             logger.log(
                 f"Epoch {epoch + 1} out of {args['n_epochs']} - train_loss: {avg_train_loss:.6f} - train_acc: {train_acc:.6f} - "
                 f"val_loss: {val_loss:.6f} - val_acc: {val_acc:.6f}")
-            wandb.log({"train_loss": avg_train_loss, "train_acc": train_acc, "val_loss": val_loss, "val_acc": val_acc,
-                       "epoch": epoch + 1})
+            epoch_metrics = {"train_loss": avg_train_loss, "train_acc": train_acc, "val_loss": val_loss,
+                             "val_acc": val_acc, "epoch": epoch + 1}
+
+            if val_step_losses:
+                epoch_metrics["val_loss_step"] = sum(val_step_losses) / len(val_step_losses)
+                epoch_metrics["val_acc_step"] = sum(val_step_accs) / len(val_step_accs)
 
-            early_stopping_monitor(model=model, val_loss=val_loss, optimizer=optimizer)
+            wandb.log(epoch_metrics)
+
+            # checkpoint the inner module so compiled runs stay loadable in eager mode
+            early_stopping_monitor(model=getattr(model, "_orig_mod", model), val_loss=val_loss, optimizer=optimizer)
 
             if early_stopping_monitor.early_stop:
                 logger.log(f"Stopping training at Epoch: {epoch}. Val_loss did not improve in "
@@ -329,55 +480,111 @@ def train_model(args, config=None):
                            f"Best score: {early_stopping_monitor.best_score:.6f}")
                 break
 
-            torch.cuda.empty_cache()
             lr_scheduler.step()
 
+        early_stopping_monitor.close()
+        logger.close()
+
     wandb.finish()
 
 
 def train_epoch(model: C3DPNet, train_dataloader: DataLoader, optimizer: torch.optim.Optimizer, epoch: int,
-                n_epochs: int) -> Tuple[float, float]:
-    cum_loss = 0.0
+                n_epochs: int, log_every_n_steps: int = LOG_EVERY_N_STEPS,
+                autocast_dtype: Optional[torch.dtype] = None,
+                scaler: Optional["torch.cuda.amp.GradScaler"] = None) -> Tuple[float, float]:
     num_batches = len(train_dataloader)
 
     progress_bar = tqdm(enumerate(train_dataloader), total=num_batches, desc=f'Epoch {epoch + 1}/{n_epochs}',
                         file=sys.stdout)
 
-    train_acc = torch.tensor(0.0)
     model.train()
     device = next(model.parameters()).device
     dtype = next(model.parameters()).dtype
+    non_blocking = device.type == "cuda"
+
+    # keep the running sums on-device and only sync with the host every log_every_n_steps batches
+    train_acc = torch.zeros((), device=device)
+    cum_loss = torch.zeros((), device=device)
+    window_loss = torch.zeros((), device=device)
+    window_acc = torch.zeros((), device=device)
+
+    # every full batch shares the same ground-truth tensor; only the last partial batch differs
+    full_batch_size = train_dataloader.batch_size
+    gt_full = _ground_truth(full_batch_size, device)
+
+    step_losses, step_accs = [], []
 
     for batch_idx, data in progress_bar:
-        data = data.to(device, dtype)
-        optimizer.zero_grad()  # # Clear gradients
-        output = model(data.x, data.edge_index, data.sequence_A, data.batch,
-                       return_dict=True)  # forward pass + compute loss
-        cum_loss += output["loss"].item()
+        data = data.to(device, dtype, non_blocking=non_blocking)
+        optimizer.zero_grad(set_to_none=True)  # # Clear gradients
 
-        output["loss"].backward()  # Derive gradients
-        optimizer.step()  # Update parameters based on gradients 
+        # forward pass + compute loss, in reduced precision when requested
+        if autocast_dtype is not None:
+            with torch.autocast(device_type="cuda", dtype=autocast_dtype):
+                output = model(data.x, data.edge_index, data.sequence_A, data.batch, return_dict=True)
+        else:
+            output = model(data.x, data.edge_index, data.sequence_A, data.batch, return_dict=True)
 
-        acc = compute_accuracy(output["logits"], len(data))
+        if scaler is not None:
+            scaler.scale(output["loss"]).backward()  # Derive gradients
+            scaler.step(optimizer)  # Update parameters based on gradients
+            scaler.update()
+        else:
+            output["loss"].backward()  # Derive gradients
+            optimizer.step()  # Update parameters based on gradients
+
+        n_graphs = data.num_graphs
+        ground_truth = gt_full if n_graphs == full_batch_size else _ground_truth(n_graphs, device)
+        acc = compute_accuracy(output["logits"], n_graphs, ground_truth=ground_truth)
         train_acc = compute_running_accuracy(acc, train_acc, batch_idx + 1)
 
-        progress_bar.set_postfix({'train_step_loss': output["loss"].item(), 'acc_step': acc.item()})
-        wandb.log({"train_step_loss": output["loss"].item(), 'acc_step': acc.item()})
+        cum_loss += output["loss"].detach()
+        window_loss += output["loss"].detach()
+        window_acc += acc
+
+        if (batch_idx + 1) % log_every_n_steps == 0:
+            # a single stack + cpu() transfer instead of one sync per metric per batch
+            loss_step, acc_step = (torch.stack([window_loss, window_acc]) / log_every_n_steps).cpu().tolist()
+            progress_bar.set_postfix({'train_step_loss': loss_step, 'acc_step': acc_step})
+            step_losses.append(loss_step)
+            step_accs.append(acc_step)
+            window_loss.zero_()
+            window_acc.zero_()
+
+    # flush the trailing partial window so short epochs and remainder batches are not dropped
+    remainder = num_batches % log_every_n_steps
+    if remainder:
+        loss_step, acc_step = (torch.stack([window_loss, window_acc]) / remainder).cpu().tolist()
+        progress_bar.set_postfix({'train_step_loss': loss_step, 'acc_step': acc_step})
+        step_losses.append(loss_step)
+        step_accs.append(acc_step)
 
     progress_bar.close()
 
+    # one wandb call per epoch instead of one per logging window keeps serialization off the hot path
+    if step_losses:
+        wandb.log({"train_step_loss": sum(step_losses) / len(step_losses),
+                   'acc_step': sum(step_accs) / len(step_accs)})
+
     # Returning the average batch loss and accuracy
-    return cum_loss / num_batches, train_acc
+    return (cum_loss / num_batches).item(), train_acc.item()
 
 
-def compute_running_accuracy(curr_acc: torch.Tensor, prev_acc: torch.Tensor, step: int) -> float:
+def compute_running_accuracy(curr_acc: torch.Tensor, prev_acc: torch.Tensor, step: int) -> torch.Tensor:
     return prev_acc + 1 / (step) * (curr_acc - prev_acc)
 
 
-def compute_accuracy(graph_logits: torch.Tensor, batch_size: int):
-    ground_truth = torch.arange(len(graph_logits)).to(graph_logits.device)
+@functools.lru_cache(maxsize=16)
+def _ground_truth(n: int, device: torch.device) -> torch.Tensor:
+    # the size only varies on the last partial batch, so the same tensor is reused all epoch
+    return torch.arange(n, device=device)
+
+
+def compute_accuracy(graph_logits: torch.Tensor, batch_size: int, ground_truth: Optional[torch.Tensor] = None):
+    if ground_truth is None:
+        ground_truth = _ground_truth(graph_logits.size(0), graph_logits.device)
 
-    acc_g = (torch.argmax(graph_logits, 1) == ground_truth).sum()
-    acc_d = (torch.argmax(graph_logits, 0) == ground_truth).sum()
+    acc_g = graph_logits.argmax(1).eq(ground_truth).sum()
+    acc_d = graph_logits.argmax(0).eq(ground_truth).sum()
 
     return (acc_g + acc_d) / 2 / batch_size